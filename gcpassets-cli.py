@@ -1,16 +1,21 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
 import csv
-import itertools
 import json
 import os
 import re
 import sys
-import threading
-import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from operator import itemgetter
 from google.cloud import asset_v1
-from google.protobuf.json_format import MessageToDict
+from google.protobuf.json_format import MessageToJson
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Embedded API type aliases
 ASSET_TYPE_MAPPING = {
@@ -58,70 +63,81 @@ ASSET_TYPE_MAPPING = {
     'vpntunnel': 'compute.googleapis.com/VpnTunnel'
 }
 
-class Spinner:
-    """
-    A simple spinner class for command-line interfaces
-    """
-    def __init__(self, message):
-        self.message = message
-        self.running = False
-        self.spinner = itertools.cycle(['-', '/', '|', '\\'])
-        self.thread = threading.Thread(target=self._spin)
-
-    def start(self):
-        self.running = True
-        self.thread.start()
+# Prefix of Cloud Resource Manager full resource names
+CRM_RESOURCE_PREFIX = "//cloudresourcemanager.googleapis.com/"
 
-    def _spin(self):
-        while self.running:
-            sys.stdout.write(f"\r{self.message} {next(self.spinner)}")
-            sys.stdout.flush()
-            time.sleep(0.1)
+# Upper bound on concurrent search streams when partitioning a scope
+MAX_CONCURRENT_STREAMS = 10
 
-    def stop(self):
-        self.running = False
-        self.thread.join()
-        sys.stdout.write("\r" + " " * (len(self.message) + 2) + "\r")
-        sys.stdout.flush()
+@dataclass
+class AssetEntry:
+    """
+    A resource-manager asset (organization, folder or project) returned by fetch_assets
+    """
+    __slots__ = ('name', 'asset_type', 'display_name', 'parent')
+    name: str
+    asset_type: str
+    display_name: str
+    parent: str
 
-def fetch_assets(scope, debug=False):
+async def fetch_assets(scope, debug=False):
     """
     Fetches GCP assets (organizations, folders, projects) for the given scope.
 
+    Each asset type is fetched as its own concurrent stream.
+
     Args:
         scope: The GCP scope to search within (e.g., organizations/1234567890)
         debug: If True, prints debug information
 
     Returns:
-        List of asset dictionaries with their hierarchy information
+        List of AssetEntry records with their hierarchy information
     """
-    client = asset_v1.AssetServiceClient()
+    client = asset_v1.AssetServiceAsyncClient()
     asset_types_to_fetch = [
         "cloudresourcemanager.googleapis.com/Organization",
         "cloudresourcemanager.googleapis.com/Folder",
         "cloudresourcemanager.googleapis.com/Project"
     ]
-    assets_from_api = []
-    try:
-        first_resource = None
-        for i, asset in enumerate(client.search_all_resources(scope=scope, asset_types=asset_types_to_fetch)):
-            if i == 0:
-                first_resource = asset
-
-            assets_from_api.append({
-                'name': asset.name,
-                'asset_type': asset.asset_type,
-                'display_name': getattr(asset, 'display_name', ''),
-                'parent': asset.parent_full_resource_name.replace("//cloudresourcemanager.googleapis.com/", "")
+    first_resources = {}
+
+    async def _fetch(asset_type):
+        results = []
+        # A failing stream reports its error and keeps what it collected,
+        # so it does not discard the results of the other streams
+        try:
+            # page_size is only accepted through the request object, not as a keyword
+            response = await client.search_all_resources(request={
+                "scope": scope,
+                "asset_types": [asset_type],
+                "page_size": 500
             })
-        if debug and first_resource:
+            async for asset in response:
+                if not results:
+                    first_resources[asset_type] = asset
+
+                results.append(AssetEntry(
+                    name=asset.name,
+                    asset_type=asset.asset_type,
+                    display_name=getattr(asset, 'display_name', ''),
+                    parent=asset.parent_full_resource_name.removeprefix(CRM_RESOURCE_PREFIX)
+                ))
+        except Exception as e:
+            print(f"Error fetching {asset_type} assets from GCP: {e}")
+        return results
+
+    assets_from_api = []
+    results = await asyncio.gather(*(_fetch(t) for t in asset_types_to_fetch))
+    for result in results:
+        assets_from_api.extend(result)
+    if debug:
+        first_resource = next((first_resources[t] for t in asset_types_to_fetch if t in first_resources), None)
+        if first_resource:
             print("Debug: First resource raw data:")
-            print(json.dumps(MessageToDict(first_resource._pb), indent=2))
-    except Exception as e:
-        print(f"Error fetching assets from GCP: {e}")
+            print(MessageToJson(first_resource._pb, indent=2))
     return assets_from_api
 
-def fetch_flat_resources(scope, asset_type, debug=False):
+async def fetch_flat_resources(scope, asset_type, debug=False, partition_by_project=False):
     """
     Fetches GCP resources of a specific type for the given scope.
 
@@ -129,50 +145,80 @@ def fetch_flat_resources(scope, asset_type, debug=False):
         scope: The GCP scope to search within (e.g., organizations/1234567890)
         asset_type: The type of resource to fetch (e.g., compute.googleapis.com/Instance)
         debug: If True, prints the first resource in raw format and exits
+        partition_by_project: If True, searches each project under the scope as its
+            own concurrent stream. Resources not owned by a project are not returned.
 
     Returns:
         List of resource dictionaries with their details
     """
-    client = asset_v1.AssetServiceClient()
+    client = asset_v1.AssetServiceAsyncClient()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_STREAMS)
+
+    async def _stream(stream_scope):
+        results = []
+        async with semaphore:
+            # A failing stream reports its error and keeps what it collected,
+            # so it does not discard the results of the other streams
+            try:
+                # page_size is only accepted through the request object, not as a keyword
+                response = await client.search_all_resources(request={
+                    "scope": stream_scope,
+                    "asset_types": [asset_type],
+                    "page_size": 500
+                })
+                async for resource in response:
+                    if debug:
+                        # In debug mode, print the raw first resource and exit
+                        print(MessageToJson(resource._pb, indent=2))
+                        return []
+
+                    # ResourceSearchResult always defines these fields, so read them directly
+                    results.append({
+                        'name': resource.name,
+                        'asset_type': resource.asset_type,
+                        'project': resource.project,
+                        'display_name': resource.display_name,
+                        'location': resource.location,
+                        'parent_full_resource_name': resource.parent_full_resource_name
+                    })
+            except Exception as e:
+                print(f"Error fetching resources in {stream_scope} from GCP: {e}")
+        return results
+
     resources_data = []
     seen_resources = set()
     try:
-        first_resource = None
-        for i, resource in enumerate(client.search_all_resources(scope=scope, asset_types=[asset_type])):
-            if i == 0:
-                first_resource = resource
-                if debug:
-                    # In debug mode, print the raw first resource and exit
-                    print(json.dumps(MessageToDict(first_resource._pb), indent=2))
-                    return []
-
-            resource_dict = {
-                'name': resource.name,
-                'asset_type': resource.asset_type,
-                'project': resource.project,
-                'display_name': getattr(resource, 'display_name', ''),
-                'location': getattr(resource, 'location', ''),
-                'parent_full_resource_name': resource.parent_full_resource_name
-            }
-
-            # Handle BigQuery dataset duplicates
-            if resource.asset_type == "bigquery.googleapis.com/Dataset":
-                key = (resource_dict['project'], resource_dict['name'])
-                if key in seen_resources:
-                    continue
-                seen_resources.add(key)
-                resources_data.append(resource_dict)
-            else:
+        stream_scopes = [scope]
+        if partition_by_project and not debug and not scope.startswith("projects/"):
+            response = await client.search_all_resources(request={
+                "scope": scope,
+                "asset_types": ["cloudresourcemanager.googleapis.com/Project"],
+                "page_size": 500
+            })
+            stream_scopes = [project.project async for project in response]
+
+        results = await asyncio.gather(*(_stream(s) for s in stream_scopes))
+
+        for stream_results in results:
+            for resource_dict in stream_results:
+                # Handle BigQuery dataset duplicates
+                if resource_dict['asset_type'] == "bigquery.googleapis.com/Dataset":
+                    key = (resource_dict['project'], resource_dict['name'])
+                    if key in seen_resources:
+                        continue
+                    seen_resources.add(key)
                 resources_data.append(resource_dict)
 
     except Exception as e:
         print(f"Error fetching resources from GCP: {e}")
     return resources_data
 
-def fetch_folder_hierarchy(scope, debug=False):
+async def fetch_folder_hierarchy(scope, debug=False):
     """
     Fetches folder hierarchy from GCP
 
+    Folders and projects are fetched concurrently as two independent streams.
+
     Args:
         scope: GCP scope
         debug: Whether to enable debug output
@@ -180,40 +226,41 @@ def fetch_folder_hierarchy(scope, debug=False):
     Returns:
         List of folders and projects
     """
-    client = asset_v1.AssetServiceClient()
-    folders = []
-    projects = []
-
-    # Fetch folders
-    response = client.search_all_resources(
-        scope=scope,
-        asset_types=["cloudresourcemanager.googleapis.com/Folder"],
-        page_size=500
-    )
-
-    for i, folder in enumerate(response):
-        if debug and i == 0:
-            print(json.dumps(MessageToDict(folder._pb), indent=2))
-            return []  # Exit after printing first resource in debug mode
-
-        folder_dict = MessageToDict(folder._pb)
-        folders.append(folder_dict)
-
-    # Fetch projects
-    response = client.search_all_resources(
-        scope=scope,
-        asset_types=["cloudresourcemanager.googleapis.com/Project"],
-        page_size=500
-    )
-
-    for i, project in enumerate(response):
-        if debug and i == 0:
-            print(json.dumps(MessageToDict(project._pb), indent=2))
-            return []  # Exit after printing first resource in debug mode
+    client = asset_v1.AssetServiceAsyncClient()
+    asset_types_to_fetch = [
+        "cloudresourcemanager.googleapis.com/Folder",
+        "cloudresourcemanager.googleapis.com/Project"
+    ]
 
-        project_dict = MessageToDict(project._pb)
-        projects.append(project_dict)
+    async def _search(asset_type):
+        # page_size is only accepted through the request object, not as a keyword
+        return await client.search_all_resources(request={
+            "scope": scope,
+            "asset_types": [asset_type],
+            "page_size": 500
+        })
+
+    if debug:
+        # Print only the first resource, folders before projects, and exit
+        for asset_type in asset_types_to_fetch:
+            async for resource in await _search(asset_type):
+                print(MessageToJson(resource._pb, indent=2))
+                return []
+        return []
+
+    async def _fetch(asset_type):
+        results = []
+        async for resource in await _search(asset_type):
+            # Build the dict from the known fields rather than reflecting over the message
+            results.append({
+                'name': resource.name,
+                'assetType': resource.asset_type,
+                'displayName': getattr(resource, 'display_name', ''),
+                'parentFullResourceName': resource.parent_full_resource_name
+            })
+        return results
 
+    folders, projects = await asyncio.gather(*(_fetch(t) for t in asset_types_to_fetch))
     return folders + projects
 
 def load_asset_type_mapping():
@@ -223,14 +270,14 @@ def load_asset_type_mapping():
     Returns:
         Dictionary of asset type aliases
     """
-    return dict(sorted(ASSET_TYPE_MAPPING.items()))
+    return ASSET_TYPE_MAPPING
 
 def build_folder_tree(assets, queried_parent_type, queried_parent_id):
     """
     Builds a hierarchical tree of folders and projects from the given assets.
 
     Args:
-        assets: List of asset dictionaries
+        assets: List of AssetEntry records
         queried_parent_type: Type of the parent asset (e.g., organizations, folders)
         queried_parent_id: ID of the parent asset
 
@@ -242,77 +289,71 @@ def build_folder_tree(assets, queried_parent_type, queried_parent_id):
     projects = []
 
     for a in assets:
-        asset_type = a.get('asset_type', '')
-        name_parts = a.get('name', '').split('/')
-        bare_name = name_parts[-1] if name_parts and name_parts[-1] else ''
-        display_name = a.get('display_name', '')
+        asset_type = a.asset_type
+        is_folder = asset_type.endswith('/Folder')
+        # Only folders and projects make it into the tree; skip everything else early
+        if not is_folder and not asset_type.endswith('/Project'):
+            continue
+
+        bare_name = a.name.rpartition('/')[2]
+        display_name = a.display_name
         id_part = bare_name
 
-        parent_full_resource_name = a.get('parent', '')
+        # The parent is already stripped of its service prefix by fetch_assets
+        parent_full_resource_name = a.parent
         parent_id_type, parent_id_value = '', ''
-        if parent_full_resource_name:
-            standardized_parent_str = parent_full_resource_name.replace("//cloudresourcemanager.googleapis.com/", "")
-            if '/' in standardized_parent_str:
-                parent_id_type, parent_id_value = standardized_parent_str.split('/', 1)
+        if '/' in parent_full_resource_name:
+            parent_id_type, _, parent_id_value = parent_full_resource_name.partition('/')
 
         entry = {
             'id': id_part,
-            'name': a.get('name',''),
+            'name': a.name,
             'display_name': display_name,
             'parent_id_type': parent_id_type,
             'parent_id_value': parent_id_value,
             'asset_type': asset_type
         }
 
-        if asset_type.endswith('/Folder'):
+        if is_folder:
             folders.append(entry)
-        elif asset_type.endswith('/Project'):
+        else:
             projects.append(entry)
             if parent_id_type == queried_parent_type and parent_id_value == queried_parent_id:
                 root_level_projects.append(entry)
 
+    # Sort by display name once; linking below preserves this order at every level,
+    # so output formats can walk the tree without re-sorting
+    def display_name_key(entry):
+        return entry['display_name'].lower()
+
+    folders.sort(key=display_name_key)
+    projects.sort(key=display_name_key)
+    root_level_projects.sort(key=display_name_key)
+
+    # Index every folder once, then link each node to its parent in a single pass
+    nodes = {
+        folder['id']: {
+            'folder': folder,
+            'projects': [],
+            'subfolders': {}
+        }
+        for folder in folders
+    }
+
     folder_tree = {}
-    # Start with folders directly under the queried parent
     for folder in folders:
         if folder['parent_id_type'] == queried_parent_type and folder['parent_id_value'] == queried_parent_id:
-            folder_id = folder['id']
-            folder_tree[folder_id] = {
-                'folder': folder,
-                'projects': [],
-                'subfolders': {}
-            }
-
-    # Function to recursively add subfolders
-    def add_subfolders(folder_id, current_level):
-        for folder in folders:
-            if folder['parent_id_type'] == 'folders' and folder['parent_id_value'] == folder_id:
-                subfolder_id = folder['id']
-                current_level['subfolders'][subfolder_id] = {
-                    'folder': folder,
-                    'projects': [],
-                    'subfolders': {}
-                }
-                add_subfolders(subfolder_id, current_level['subfolders'][subfolder_id])
-
-    # Build the tree recursively starting from root folders
-    for folder_id, folder_data in folder_tree.items():
-        add_subfolders(folder_id, folder_data)
+            # Folders directly under the queried parent
+            folder_tree[folder['id']] = nodes[folder['id']]
+        elif folder['parent_id_type'] == 'folders':
+            parent_node = nodes.get(folder['parent_id_value'])
+            if parent_node:
+                parent_node['subfolders'][folder['id']] = nodes[folder['id']]
 
     # Assign projects to folders
     for project in projects:
         if project['parent_id_type'] == 'folders':
-            folder_id = project['parent_id_value']
-            # Find the folder in the tree
-            def find_folder(tree, target_id):
-                for folder_id, folder_data in tree.items():
-                    if folder_id == target_id:
-                        return folder_data
-                    found = find_folder(folder_data['subfolders'], target_id)
-                    if found:
-                        return found
-                return None
-
-            folder_node = find_folder(folder_tree, folder_id)
+            folder_node = nodes.get(project['parent_id_value'])
             if folder_node:
                 folder_node['projects'].append(project)
 
@@ -328,34 +369,27 @@ def generate_tree_output(hierarchy_data):
     Args:
         hierarchy_data: Dictionary representing the hierarchical tree
 
-    Returns:
-        String representation of the tree
+    Yields:
+        Lines of the tree
     """
-    output_lines = []
-
     # Root level projects
-    for project in sorted(hierarchy_data['root_projects'], key=lambda p: p['display_name']):
-        output_lines.append(f"- {project['display_name']} ({project['id']})")
+    for project in hierarchy_data['root_projects']:
+        yield f"- {project['display_name']} ({project['id']})"
 
-    # Recursive function for folders
-    def print_folder(folder_data, level=0):
+    # Walk folders depth-first with an explicit stack, children pushed in reverse
+    stack = [(folder_data, 0) for folder_data in reversed(list(hierarchy_data['folder_tree'].values()))]
+    while stack:
+        folder_data, level = stack.pop()
         indent = '  ' * level
         folder = folder_data['folder']
-        output_lines.append(f"{indent}[{folder['display_name']}] ({folder['id']})")
+        yield f"{indent}[{folder['display_name']}] ({folder['id']})"
 
         # Projects in this folder
-        for project in sorted(folder_data['projects'], key=lambda p: p['display_name']):
-            output_lines.append(f"{indent}  - {project['display_name']} ({project['id']})")
+        for project in folder_data['projects']:
+            yield f"{indent}  - {project['display_name']} ({project['id']})"
 
         # Subfolders
-        for subfolder_id, subfolder_data in sorted(folder_data['subfolders'].items(), key=lambda x: x[1]['folder']['display_name']):
-            print_folder(subfolder_data, level+1)
-
-    # Root level folders
-    for folder_id, folder_data in sorted(hierarchy_data['folder_tree'].items(), key=lambda x: x[1]['folder']['display_name']):
-        print_folder(folder_data)
-
-    return "\n".join(output_lines)
+        stack.extend((subfolder_data, level + 1) for subfolder_data in reversed(list(folder_data['subfolders'].values())))
 
 def generate_json_output(hierarchy_data):
     """
@@ -367,18 +401,15 @@ def generate_json_output(hierarchy_data):
     Returns:
         JSON string representation of the tree
     """
-    # Convert hierarchy to JSON-serializable format
-    def folder_to_dict(folder_data):
-        return {
-            'folder': folder_data['folder'],
-            'projects': folder_data['projects'],
-            'subfolders': {fid: folder_to_dict(fd) for fid, fd in folder_data['subfolders'].items()}
-        }
-
-    return json.dumps({
+    # The tree is built from plain dicts, lists and strings, so it can be dumped as is
+    output = {
         'organization_projects': hierarchy_data['root_projects'],
-        'folders': {fid: folder_to_dict(fd) for fid, fd in hierarchy_data['folder_tree'].items()}
-    }, indent=2)
+        'folders': hierarchy_data['folder_tree']
+    }
+    if orjson is not None:
+        return orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()
+    # ensure_ascii=False matches orjson, which writes non-ASCII characters as UTF-8
+    return json.dumps(output, indent=2, ensure_ascii=False)
 
 def generate_tabular_output(hierarchy_data):
     """
@@ -401,8 +432,10 @@ def generate_tabular_output(hierarchy_data):
             ''  # No parent
         ])
 
-    # Recursive function for folders and their projects
-    def process_folder(folder_data, parent_display_name):
+    # Walk folders depth-first with an explicit stack, children pushed in reverse
+    stack = [(folder_data, '') for folder_data in reversed(list(hierarchy_data['folder_tree'].values()))]
+    while stack:
+        folder_data, parent_display_name = stack.pop()
         folder = folder_data['folder']
         # Add the folder itself
         rows.append([
@@ -422,12 +455,7 @@ def generate_tabular_output(hierarchy_data):
             ])
 
         # Subfolders
-        for subfolder_data in folder_data['subfolders'].values():
-            process_folder(subfolder_data, folder['display_name'])
-
-    # Root level folders
-    for folder_data in hierarchy_data['folder_tree'].values():
-        process_folder(folder_data, '')
+        stack.extend((subfolder_data, folder['display_name']) for subfolder_data in reversed(list(folder_data['subfolders'].values())))
 
     return rows
 
@@ -443,16 +471,14 @@ def print_resource_table(resources, scope):
         print("No resources found.")
         return
 
-    # Sort resources by project and then by name
-    sorted_resources = sorted(resources, key=lambda r: (r.get('project', ''), r['name']))
-
     # Print scope header
     print(f"Scope: {scope}")
 
     headers = ["Name", "Project ID", "Location"]
     rows = []
+    max_widths = [len(header) for header in headers]
 
-    for resource in sorted_resources:
+    for resource in resources:
         name_parts = resource['name'].split('/')
         short_name = name_parts[-1] if name_parts else resource['name']
 
@@ -460,7 +486,7 @@ def print_resource_table(resources, scope):
         project_id = ""
         if 'parent_full_resource_name' in resource:
             parent_full = resource.get('parent_full_resource_name', '')
-            if parent_full.startswith("//cloudresourcemanager.googleapis.com/projects/"):
+            if parent_full.startswith(CRM_RESOURCE_PREFIX + "projects/"):
                 project_id = parent_full.split("/")[-1]
 
         location = resource.get('location', '')
@@ -475,18 +501,35 @@ def print_resource_table(resources, scope):
             project_id,
             location
         ]
-        rows.append(row_data)
+        # Sort on what the table shows, breaking ties by the full resource name
+        # so rows with the same short name in one project keep a stable order
+        rows.append(((project_id, short_name, resource.get('project', ''), resource['name']), row_data))
 
-    # Calculate max widths for each column
-    max_widths = [max(len(str(row[i])) for row in rows + [headers]) for i in range(len(headers))]
+        # Track max widths for each column as rows are built
+        max_widths = [max(width, len(field)) for width, field in zip(max_widths, row_data)]
+
+    # Sort rows by project ID and then by name
+    rows.sort(key=lambda pair: pair[0])
 
     # Print table
     header_line = "  ".join(headers[i].ljust(max_widths[i]) for i in range(len(headers)))
     print(header_line)
     print("-" * len(header_line))
-    for row in sorted(rows, key=lambda x: (x[1], x[0])):
+    for _, row in rows:
         print("  ".join(str(row[i]).ljust(max_widths[i]) for i in range(len(row))))
 
+def write_lines(lines):
+    """
+    Writes lines to stdout as they are produced.
+
+    Args:
+        lines: Iterable of lines without trailing newlines
+    """
+    write = sys.stdout.write
+    for line in lines:
+        write(line)
+        write("\n")
+
 def print_tree_output(hierarchy_data):
     """
     Prints the hierarchical tree.
@@ -494,7 +537,7 @@ def print_tree_output(hierarchy_data):
     Args:
         hierarchy_data: Dictionary representing the hierarchical tree
     """
-    print(generate_tree_output(hierarchy_data))
+    write_lines(generate_tree_output(hierarchy_data))
 
 def print_json_output(hierarchy_data):
     """
@@ -515,18 +558,17 @@ def print_tabular_output(hierarchy_data):
     tabular_rows = generate_tabular_output(hierarchy_data)
     # Define column widths for fixed-length feel
     col_widths = [30, 40, 10, 30] # Adjust as needed: ID, DisplayName, Type, ParentID
-    header_format_string = "{:<%d} {:<%d} {:<%d} {:<%d}" % tuple(col_widths)
-    row_format_string = "{:<%d} {:<%d} {:<%d} {:<%d}" % tuple(col_widths)
+    row_format_string = " ".join(f"{{:<{width}}}" for width in col_widths)
 
     headers = ["ID", "Display_Name", "Type", "Parent_ID"]
-    print(header_format_string.format(*headers))
+    print(row_format_string.format(*headers))
     print("-" * (sum(col_widths) + len(col_widths) * 2))
 
     if tabular_rows:
-        for row_data in sorted(tabular_rows, key=lambda x: (x[0], x[1])):
-            # Ensure all row elements are strings for formatting
-            formatted_row = [str(field) for field in row_data]
-            print(row_format_string.format(*formatted_row))
+        # Rows are freshly built lists of strings, so sort them in place
+        tabular_rows.sort(key=itemgetter(0, 1))
+        for row_data in tabular_rows:
+            print(row_format_string.format(*row_data))
     else:
         print("No data to display in tabular format.")
 
@@ -539,85 +581,90 @@ def generate_pretty_tree_output(folder_data, prefix='', is_last=False):
         prefix: Prefix for indentation
         is_last: If True, this is the last child
 
-    Returns:
-        List of lines for the pretty tree
+    Yields:
+        Lines of the pretty tree
     """
-    output = []
+    # Each stack entry is a folder, the prefix for its children and its own header line
+    stack = [(folder_data, prefix, None)]
+    while stack:
+        folder_data, prefix, header = stack.pop()
+        if header is not None:
+            yield header
 
-    # Print projects in this folder
-    projects = folder_data.get('projects', [])
-    # Sort projects by display name
-    projects = sorted(projects, key=lambda x: x['display_name'].lower())
+        # Print projects in this folder
+        projects = folder_data.get('projects', [])
 
-    for i, project in enumerate(projects):
-        is_last_project = i == len(projects) - 1 and not folder_data.get('subfolders')
-        connector = '└── ' if is_last_project else '├── '
-        output.append(f"{prefix}{connector}📄 {project['display_name']}")
-
-    # Print subfolders
-    if 'subfolders' in folder_data:
-        folders = folder_data['subfolders']
-        # Sort folders by display name
-        folder_ids = sorted(folders.keys(), key=lambda k: folders[k]['folder']['display_name'].lower())
+        for i, project in enumerate(projects):
+            is_last_project = i == len(projects) - 1 and not folder_data.get('subfolders')
+            connector = '└── ' if is_last_project else '├── '
+            yield f"{prefix}{connector}📄 {project['display_name']}"
 
-        for i, folder_id in enumerate(folder_ids):
-            is_last_folder = i == len(folder_ids) - 1
-            connector = '└── ' if is_last_folder else '├── '
-            output.append(f"{prefix}{connector}📁 {folders[folder_id]['folder']['display_name']}")
+        # Queue subfolders
+        if 'subfolders' in folder_data:
+            folders = folder_data['subfolders']
+            folder_ids = list(folders)
 
-            # Create new prefix for children
-            child_prefix = prefix + ("    " if is_last_folder else "│   ")
+            children = []
+            for i, folder_id in enumerate(folder_ids):
+                is_last_folder = i == len(folder_ids) - 1
+                connector = '└── ' if is_last_folder else '├── '
 
-            # Recursively generate output for subfolder
-            sub_output = generate_pretty_tree_output(
-                folders[folder_id],
-                child_prefix,
-                is_last_folder
-            )
-            output.extend(sub_output)
+                # Create new prefix for children
+                child_prefix = prefix + ("    " if is_last_folder else "│   ")
+                children.append((
+                    folders[folder_id],
+                    child_prefix,
+                    f"{prefix}{connector}📁 {folders[folder_id]['folder']['display_name']}"
+                ))
 
-    return output
+            stack.extend(reversed(children))
 
-def print_pretty_tree_output(hierarchy_data, scope):
+def generate_pretty_root_output(hierarchy_data, scope):
     """
-    Prints the pretty string representation of the hierarchical tree.
+    Generates the pretty tree starting from the scope header.
 
     Args:
         hierarchy_data: Dictionary representing the hierarchical tree
         scope: The scope of the tree
+
+    Yields:
+        Lines of the pretty tree
     """
-    output = [f"Scope: {scope}"]
+    yield f"Scope: {scope}"
 
     # Print root projects
     projects = hierarchy_data.get('root_projects', [])
-    # Sort root projects by display name
-    projects = sorted(projects, key=lambda x: x['display_name'].lower())
 
     for i, project in enumerate(projects):
         is_last_project = i == len(projects) - 1 and not hierarchy_data.get('folder_tree')
         connector = '└── ' if is_last_project else '├── '
-        output.append(f"{connector}📄 {project['display_name']}")
+        yield f"{connector}📄 {project['display_name']}"
 
     # Print folder tree
     folder_tree = hierarchy_data.get('folder_tree', {})
-    # Sort top-level folders by display name
-    folder_ids = sorted(folder_tree.keys(), key=lambda k: folder_tree[k]['folder']['display_name'].lower())
+    folder_ids = list(folder_tree)
 
     for i, folder_id in enumerate(folder_ids):
         folder_data = folder_tree[folder_id]
         is_last_folder = i == len(folder_ids) - 1
         connector = '└── ' if is_last_folder else '├── '
-        output.append(f"{connector}📁 {folder_data['folder']['display_name']}")
+        yield f"{connector}📁 {folder_data['folder']['display_name']}"
 
         # Create prefix for children
         child_prefix = "    " if is_last_folder else "│   "
 
         # Generate output for folder
-        folder_output = generate_pretty_tree_output(folder_data, child_prefix, is_last_folder)
-        output.extend(folder_output)
+        yield from generate_pretty_tree_output(folder_data, child_prefix, is_last_folder)
+
+def print_pretty_tree_output(hierarchy_data, scope):
+    """
+    Prints the pretty string representation of the hierarchical tree.
 
-    for line in output:
-        print(line)
+    Args:
+        hierarchy_data: Dictionary representing the hierarchical tree
+        scope: The scope of the tree
+    """
+    write_lines(generate_pretty_root_output(hierarchy_data, scope))
 
 def print_csv_output(resources, scope):
     """
@@ -634,20 +681,12 @@ def print_csv_output(resources, scope):
     # Print header
     print("Name,Project ID,Location,Scope")
 
-    # Print each resource
-    for resource in resources:
-        name_parts = resource['name'].split('/')
-        short_name = name_parts[-1] if name_parts else resource['name']
-        project_id = resource['project']
-        location = resource.get('location', '')
-
-        # Escape double quotes and handle commas
-        short_name = short_name.replace('"', '""')
-        project_id = project_id.replace('"', '""')
-        location = location.replace('"', '""')
-        scope_str = scope.replace('"', '""')
-
-        print(f'"{short_name}","{project_id}","{location}","{scope_str}"')
+    # Print each resource; csv.writer handles quoting and escaping
+    writer = csv.writer(sys.stdout, quoting=csv.QUOTE_ALL, lineterminator="\n")
+    writer.writerows(
+        (resource['name'].rpartition('/')[2], resource['project'], resource.get('location', ''), scope)
+        for resource in resources
+    )
 
 def main():
     parser = argparse.ArgumentParser(description="GCP Asset Lister CLI.")
@@ -662,6 +701,7 @@ def main():
     list_parser.add_argument("--type", required=True, help="Resource type to list (e.g., compute.googleapis.com/Instance)")
     list_parser.add_argument("--format", choices=["json", "tabular", "csv"], default="tabular", help="Output format")
     list_parser.add_argument("--debug", action="store_true", help="Enable debug output")
+    list_parser.add_argument("--partition-by-project", action="store_true", help="Search each project under the scope concurrently (skips resources not owned by a project)")
 
     args = parser.parse_args()
     scope = args.scope
@@ -678,7 +718,7 @@ def main():
             return
 
         try:
-            assets = fetch_assets(scope)
+            assets = asyncio.run(fetch_assets(scope))
         except Exception as e:
             print(f"Error fetching assets from GCP: {e}")
             return
@@ -704,14 +744,13 @@ def main():
         asset_type = asset_type_mapping.get(args.type, args.type)
 
         if not args.debug:
-            spinner = Spinner(f"Fetching {args.type} resources... ")
-            spinner.start()
+            print(f"Fetching {args.type} resources...", end=" ", file=sys.stderr, flush=True)
 
         try:
-            resources = fetch_flat_resources(scope, asset_type, args.debug)
+            resources = asyncio.run(fetch_flat_resources(scope, asset_type, args.debug, args.partition_by_project))
         finally:
             if not args.debug:
-                spinner.stop()
+                print("done", file=sys.stderr, flush=True)
 
         if not resources and not args.debug:
             print("No resources found.")